@@ -3,6 +3,7 @@ from player_icons import PlayerIconManager
 from player_config import BALL_RADIUS, BALL_COLOR, BALL_START_POSITION
 from game_ui import GameUI  # Import UI for button
 from passing_lines import PassingLines  # Import passing lines
+from simulation import PressingSimulation  # Import opponent pressing simulation
 
 class HockeyPitch:
     def __init__(self, root):
@@ -30,6 +31,12 @@ class HockeyPitch:
         self.draw_ball()
         self.make_ball_draggable()
 
+        # ✅ Create the opponent pressing simulation (paused until started from the UI)
+        self.simulation = PressingSimulation(
+            self.players.players, root=root, passing_lines=self.passing_lines,
+            get_ball_position=self.get_ball_position
+        )
+
         # ✅ Initialize the UI after everything is set up
         self.ui = GameUI(root, self)
 
@@ -136,6 +143,11 @@ class HockeyPitch:
             fill=BALL_COLOR, outline="", tags="ball"
         )
 
+    def get_ball_position(self):
+        """ Returns the centre of the ball on the canvas. """
+        x1, y1, x2, y2 = self.canvas.coords(self.ball)
+        return (x1 + x2) / 2, (y1 + y2) / 2
+
     def make_ball_draggable(self):
         """ Makes the ball draggable across the screen. """
         drag_data = {"x": None, "y": None}
@@ -178,6 +190,9 @@ class HockeyPitch:
             x + BALL_RADIUS, y + BALL_RADIUS
         )
 
+        # ✅ Stop opponents so they press again from a standing start
+        self.simulation.reset()
+
 
 if __name__ == "__main__":
     root = tk.Tk()
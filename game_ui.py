@@ -35,6 +35,16 @@ class GameUI:
         )
         self.toggle_lines_button.pack(pady=10)
 
+        # ✅ Add the "Start/Pause Opponent Press" button
+        self.simulation_button = tk.Button(
+            self.control_frame,
+            text="Start Opponent Press",
+            command=self.toggle_simulation,
+            bg="black",
+            fg="white"
+        )
+        self.simulation_button.pack(pady=10)
+
         # ✅ Label for "Max Passing Length"
         self.passing_length_label = tk.Label(
             self.control_frame,
@@ -123,6 +133,12 @@ class GameUI:
         """ Toggles the visibility of passing lines. """
         self.hockey_pitch.passing_lines.toggle_passing_lines()
 
+    def toggle_simulation(self):
+        """ Starts or pauses the opponent pressing simulation and updates the button text. """
+        simulation = self.hockey_pitch.simulation
+        simulation.toggle()
+        self.simulation_button.config(text="Pause Opponent Press" if simulation.running else "Start Opponent Press")
+
     def update_max_line_length(self, value):
         """ Updates the max passing line length based on slider value and adjusts the label width dynamically. """
         self.hockey_pitch.passing_lines.set_max_length(int(value))
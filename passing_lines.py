@@ -1,3 +1,84 @@
+def passing_pairs(players):
+    """
+    Returns every ordered pair of Essendon players (excluding the GK) that can form a passing line.
+
+    Parameters:
+        players (list): List of player objects with `team` and `label` attributes.
+
+    Returns:
+        list: (player1, player2) tuples, one per passing line.
+    """
+    essendon_players = [p for p in players if p.team == "Essendon" and p.label != "GK"]
+    return [(player1, player2) for player1 in essendon_players for player2 in essendon_players if player1 != player2]
+
+
+def is_near_line(player1, player2, opponent, danger_zone):
+    """
+    Checks if an opponent is within the danger zone distance of a passing line.
+
+    Parameters:
+        player1 (PlayerIcon): First player in the passing line.
+        player2 (PlayerIcon): Second player in the passing line.
+        opponent (PlayerIcon): Opponent to check proximity.
+        danger_zone (float): Proximity threshold in pixels.
+
+    Returns:
+        bool: True if opponent is within the danger zone distance of the line, else False.
+    """
+    x1, y1 = player1.x, player1.y
+    x2, y2 = player2.x, player2.y
+    ox, oy = opponent.x, opponent.y
+
+    # Compute the distance from the opponent to the line segment
+    if (x2 - x1) == 0:  # Vertical line case
+        closest_x = x1
+        closest_y = min(max(y1, oy), y2) if y1 < y2 else min(max(y2, oy), y1)
+    else:
+        m = (y2 - y1) / (x2 - x1)  # Line slope
+        b = y1 - m * x1  # Line equation: y = mx + b
+        closest_x = (ox + m * (oy - b)) / (m**2 + 1)
+        closest_y = m * closest_x + b
+
+    # Ensure closest point is within segment bounds
+    closest_x = min(max(x1, closest_x), x2) if x1 < x2 else min(max(x2, closest_x), x1)
+    closest_y = min(max(y1, closest_y), y2) if y1 < y2 else min(max(y2, closest_y), y1)
+
+    # Compute the distance from the opponent to the closest point on the line
+    distance = ((closest_x - ox) ** 2 + (closest_y - oy) ** 2) ** 0.5
+    return distance <= danger_zone
+
+
+def evaluate_lanes(pairs, opponents, max_length, danger_zone):
+    """
+    Evaluates the state of every passing lane without touching the canvas.
+
+    Parameters:
+        pairs (iterable): (player1, player2) tuples to evaluate.
+        opponents (list): Opponent player objects.
+        max_length (float): Lines at or beyond this length are out of range.
+        danger_zone (float): Opponent proximity threshold in pixels.
+
+    Returns:
+        dict: Maps each pair to (length, colour), where colour is None if the lane is out of range,
+              "red" if an opponent is pressing it, and "black" if it is open.
+    """
+    lanes = {}
+    for player1, player2 in pairs:
+        length = ((player1.x - player2.x) ** 2 + (player1.y - player2.y) ** 2) ** 0.5
+        if length >= max_length:
+            lanes[(player1, player2)] = (length, None)
+            continue
+
+        # Determine if line should turn red based on proximity to an opponent
+        line_color = "black"
+        for opponent in opponents:
+            if is_near_line(player1, player2, opponent, danger_zone):
+                line_color = "red"
+                break  # Stop checking once red is confirmed
+        lanes[(player1, player2)] = (length, line_color)
+    return lanes
+
+
 class PassingLines:
     def __init__(self, canvas, players):
         """
@@ -14,18 +95,13 @@ class PassingLines:
         self.max_length = 300  # Default max line length, controlled by slider
         self.danger_zone = 50  # Default opponent proximity threshold, controlled by slider
 
-        # ✅ Get all Essendon players except the GK
-        essendon_players = [p for p in self.players.players if p.team == "Essendon" and p.label != "GK"]
-
-        # ✅ Create connections for each player to multiple nearby teammates
-        for player1 in essendon_players:
-            for player2 in essendon_players:
-                if player1 != player2:  # Avoid self-connection
-                    line = self.canvas.create_line(
-                        player1.x, player1.y, player2.x, player2.y,
-                        fill="black", width=10, tags="passing_lines"
-                    )
-                    self.lines[(player1, player2)] = line
+        # ✅ Create connections for each Essendon player (except the GK) to every teammate
+        for player1, player2 in passing_pairs(self.players.players):
+            line = self.canvas.create_line(
+                player1.x, player1.y, player2.x, player2.y,
+                fill="black", width=10, tags="passing_lines"
+            )
+            self.lines[(player1, player2)] = line
 
         # ✅ Ensure passing lines are drawn below player icons but above the pitch
         self.canvas.tag_lower("passing_lines", "players")
@@ -36,66 +112,35 @@ class PassingLines:
         # ✅ Attach opponents so they trigger passing line updates dynamically
         self.attach_to_opponents()
 
-    def update_lines(self):
-        """ Updates all passing lines dynamically based on player movement and proximity to opponents. """
-        opponents = [p for p in self.players.players if p.team == "Opponent"]
+    def update_lines(self, lanes=None):
+        """
+        Updates all passing lines dynamically based on player movement and proximity to opponents.
+
+        Parameters:
+            lanes (dict, optional): Pre-computed result of `evaluate_lanes`. Evaluated here if not given.
+        """
+        if lanes is None:
+            opponents = [p for p in self.players.players if p.team == "Opponent"]
+            lanes = evaluate_lanes(self.lines, opponents, self.max_length, self.danger_zone)
 
-        for (player1, player2), line in self.lines.items():
-            # Calculate new line length
-            length = ((player1.x - player2.x) ** 2 + (player1.y - player2.y) ** 2) ** 0.5
+        for pair, line in self.lines.items():
+            length, line_color = lanes[pair]
+            player1, player2 = pair
 
             # Hide line if it's too long or globally disabled
-            if length >= self.max_length or not self.lines_visible:
+            if line_color is None or not self.lines_visible:
                 self.canvas.itemconfig(line, state="hidden")
             else:
                 # Calculate dynamic thickness (10px at shortest, thinning out)
                 thickness = max(2, 10 - (length / 30))  # Decreases gradually
-                self.canvas.itemconfig(line, state="normal", width=thickness)
 
-                # Determine if line should turn red based on proximity to an opponent
-                line_color = "black"
-                for opponent in opponents:
-                    if self.is_near_line(player1, player2, opponent):
-                        line_color = "red"
-                        break  # Stop checking once red is confirmed
-
-                # Update line color and position
-                self.canvas.itemconfig(line, fill=line_color)
+                # Update line visibility, thickness, colour and position
+                self.canvas.itemconfig(line, state="normal", width=thickness, fill=line_color)
                 self.canvas.coords(line, player1.x, player1.y, player2.x, player2.y)
 
     def is_near_line(self, player1, player2, opponent):
-        """
-        Checks if an opponent is within the current danger zone distance of a passing line.
-
-        Parameters:
-            player1 (PlayerIcon): First player in the passing line.
-            player2 (PlayerIcon): Second player in the passing line.
-            opponent (PlayerIcon): Opponent to check proximity.
-
-        Returns:
-            bool: True if opponent is within the danger zone distance of the line, else False.
-        """
-        x1, y1 = player1.x, player1.y
-        x2, y2 = player2.x, player2.y
-        ox, oy = opponent.x, opponent.y
-
-        # Compute the distance from the opponent to the line segment
-        if (x2 - x1) == 0:  # Vertical line case
-            closest_x = x1
-            closest_y = min(max(y1, oy), y2) if y1 < y2 else min(max(y2, oy), y1)
-        else:
-            m = (y2 - y1) / (x2 - x1)  # Line slope
-            b = y1 - m * x1  # Line equation: y = mx + b
-            closest_x = (ox + m * (oy - b)) / (m**2 + 1)
-            closest_y = m * closest_x + b
-
-        # Ensure closest point is within segment bounds
-        closest_x = min(max(x1, closest_x), x2) if x1 < x2 else min(max(x2, closest_x), x1)
-        closest_y = min(max(y1, closest_y), y2) if y1 < y2 else min(max(y2, closest_y), y1)
-
-        # Compute the distance from the opponent to the closest point on the line
-        distance = ((closest_x - ox) ** 2 + (closest_y - oy) ** 2) ** 0.5
-        return distance <= self.danger_zone
+        """ Checks if an opponent is within the current danger zone distance of a passing line. """
+        return is_near_line(player1, player2, opponent, self.danger_zone)
 
     def attach_to_players(self):
         """ Ensures lines update dynamically when Essendon players move. """
@@ -53,3 +53,25 @@ ALL_PLAYERS = [
     ("Essendon", "RW", 1104, 523),
     ("Essendon", "CF", 856, 521),
 ]
+
+# Simulation settings
+SIM_STEPS_PER_SECOND = 60  # Fixed simulation rate, independent of the render rate
+SIM_MAX_STEPS_PER_FRAME = 5  # Drop simulation time rather than spiral if the UI falls behind
+OPPONENT_MAX_SPEED = 70  # Top pressing speed in px/s (7 m/s)
+OPPONENT_MAX_ACCEL = 40  # Acceleration limit in px/s² (4 m/s²)
+PRESS_STOP_DISTANCE = 2 * PLAYER_RADIUS  # Opponents stop this close to their target instead of overlapping it
+
+# Pressing targets per opponent: "nearest" (closest Essendon player), "ball", or "hold" (stay put)
+PRESS_TARGETS = {
+    "GK": "hold",
+    "LB": "nearest",
+    "RB": "nearest",
+    "LH": "nearest",
+    "CH": "nearest",
+    "RH": "nearest",
+    "LI": "nearest",
+    "RI": "nearest",
+    "LW": "nearest",
+    "RW": "nearest",
+    "CF": "ball",
+}
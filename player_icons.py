@@ -50,12 +50,20 @@ class PlayerIcon:
 
     def update_position(self, new_x, new_y):
         """ Updates the player's position on the canvas and updates the coordinate text. """
+        self.set_position(new_x, new_y)
+
+    def set_position(self, new_x, new_y):
+        """
+        Moves the player's icon without triggering any listeners attached to `update_position`.
+
+        Used by the simulation to move many players in one batch before redrawing passing lines once.
+        """
         self.x, self.y = new_x, new_y
         self.canvas.coords(self.circle, new_x - PLAYER_RADIUS, new_y - PLAYER_RADIUS,
                            new_x + PLAYER_RADIUS, new_y + PLAYER_RADIUS)
         self.canvas.coords(self.label_text, new_x, new_y)
         self.canvas.coords(self.coord_text, new_x, new_y + 20)
-        self.canvas.itemconfig(self.coord_text, text=f"({new_x},{new_y})")  # ✅ Update coordinate display
+        self.canvas.itemconfig(self.coord_text, text=f"({round(new_x)},{round(new_y)})")  # ✅ Update coordinate display
 
     def make_draggable(self):
         """ Enables dragging functionality for the player. """
@@ -0,0 +1,220 @@
+import math
+import time
+from player_config import (
+    ALL_PLAYERS, BALL_START_POSITION, SIM_STEPS_PER_SECOND, SIM_MAX_STEPS_PER_FRAME,
+    OPPONENT_MAX_SPEED, OPPONENT_MAX_ACCEL, PRESS_STOP_DISTANCE, PRESS_TARGETS
+)
+from passing_lines import passing_pairs, evaluate_lanes
+
+
+class SimPlayer:
+    def __init__(self, x, y, label, team):
+        """
+        Canvas-free stand-in for PlayerIcon, used when running the simulation headless.
+
+        Parameters:
+            x (float): X-coordinate.
+            y (float): Y-coordinate.
+            label (str): Position label (e.g., "GK", "CF").
+            team (str): Team name ("Essendon" or "Opponent").
+        """
+        self.x = x
+        self.y = y
+        self.label = label
+        self.team = team
+
+
+def build_headless_players():
+    """ Creates SimPlayers at the starting positions from the config file. """
+    return [SimPlayer(x, y, label, team) for team, label, x, y in ALL_PLAYERS]
+
+
+class PressingSimulation:
+    def __init__(self, players, root=None, passing_lines=None, get_ball_position=None, press_targets=None,
+                 max_speed=OPPONENT_MAX_SPEED, max_accel=OPPONENT_MAX_ACCEL, stop_distance=PRESS_STOP_DISTANCE,
+                 steps_per_second=SIM_STEPS_PER_SECOND, frame_rate=60):
+        """
+        Fixed-timestep simulation that moves opponents towards their pressing targets.
+
+        The simulation advances in steps of exactly 1 / steps_per_second seconds. In the UI the steps are
+        driven by `root.after` and caught up to wall-clock time, so the simulation rate does not depend on
+        how often the canvas is redrawn. Without a root it can be stepped directly (see `run`), which is
+        as fast as the CPU allows.
+
+        Parameters:
+            players (list): PlayerIcon or SimPlayer objects for both teams.
+            root (tk.Tk, optional): Window used to schedule the real-time loop.
+            passing_lines (PassingLines, optional): Passing lines to read settings from and redraw each frame.
+            get_ball_position (callable, optional): Returns the ball's (x, y). Defaults to the start position.
+            press_targets (dict, optional): Overrides of PRESS_TARGETS, keyed by opponent label.
+            max_speed (float): Opponent top speed in px/s.
+            max_accel (float): Opponent acceleration limit in px/s².
+            stop_distance (float): Distance from the target at which opponents stop.
+            steps_per_second (int): Simulation rate.
+            frame_rate (int): Target redraw rate of the real-time loop.
+        """
+        self.players = players
+        self.root = root
+        self.passing_lines = passing_lines
+        self.get_ball_position = get_ball_position or (lambda: BALL_START_POSITION)
+        self.press_targets = dict(PRESS_TARGETS)
+        self.press_targets.update(press_targets or {})
+        self.max_speed = max_speed
+        self.max_accel = max_accel
+        self.stop_distance = stop_distance
+        self.dt = 1.0 / steps_per_second
+        self.frame_ms = max(1, int(1000 / frame_rate))
+
+        # Headless lane settings, used when no passing lines are attached
+        self.max_length = 300
+        self.danger_zone = 50
+
+        self.opponents = [p for p in self.players if p.team == "Opponent"]
+        self.essendon_players = [p for p in self.players if p.team == "Essendon"]
+        self.pairs = passing_pairs(self.players)
+
+        self.running = False
+        self._after_id = None
+        self._last_time = None
+        self._accumulator = 0.0
+        self.reset()
+
+    def reset(self):
+        """ Stops all opponents and re-evaluates passing lanes at the current positions. """
+        self.velocities = {opponent: (0.0, 0.0) for opponent in self.opponents}
+        self.step_count = 0
+        self._accumulator = 0.0
+        self.lanes = self.evaluate_lanes()
+
+    def evaluate_lanes(self):
+        """ Evaluates every passing lane using the attached passing lines' settings (or the headless ones). """
+        settings = self.passing_lines or self
+        return evaluate_lanes(self.pairs, self.opponents, settings.max_length, settings.danger_zone)
+
+    def target_for(self, opponent, ball):
+        """
+        Returns the point an opponent is pressing towards, or None if it holds its position.
+
+        Parameters:
+            opponent (PlayerIcon): The opponent to find a target for.
+            ball (tuple): Current (x, y) of the ball.
+        """
+        mode = self.press_targets.get(opponent.label, "hold")
+        if mode == "ball":
+            return ball
+        if mode == "nearest" and self.essendon_players:
+            nearest = min(self.essendon_players, key=lambda p: (p.x - opponent.x) ** 2 + (p.y - opponent.y) ** 2)
+            return nearest.x, nearest.y
+        return None
+
+    def steer(self, opponent, target):
+        """
+        Returns the opponent's velocity for the next step, limited by max speed and acceleration.
+
+        Opponents slow down as they approach their target so they come to rest at `stop_distance`.
+        """
+        vx, vy = self.velocities[opponent]
+        desired_x = desired_y = 0.0
+        if target is not None:
+            dx, dy = target[0] - opponent.x, target[1] - opponent.y
+            distance = math.hypot(dx, dy)
+            remaining = distance - self.stop_distance
+            if remaining > 0:
+                # Fastest speed from which the opponent can still brake before reaching the stop distance
+                speed = min(self.max_speed, math.sqrt(2 * self.max_accel * remaining))
+                desired_x, desired_y = dx / distance * speed, dy / distance * speed
+
+        # Limit the change in velocity to the acceleration budget for one step
+        ax, ay = desired_x - vx, desired_y - vy
+        change = math.hypot(ax, ay)
+        max_change = self.max_accel * self.dt
+        if change > max_change:
+            ax, ay = ax / change * max_change, ay / change * max_change
+        vx, vy = vx + ax, vy + ay
+
+        speed = math.hypot(vx, vy)
+        if speed > self.max_speed:
+            vx, vy = vx / speed * self.max_speed, vy / speed * self.max_speed
+        return vx, vy
+
+    def step(self):
+        """ Advances the simulation by one fixed timestep and re-evaluates passing lanes. """
+        ball = self.get_ball_position()
+
+        # Compute every move from the same snapshot, then apply them in one batch
+        moves = []
+        for opponent in self.opponents:
+            vx, vy = self.steer(opponent, self.target_for(opponent, ball))
+            moves.append((opponent, vx, vy))
+        for opponent, vx, vy in moves:
+            self.velocities[opponent] = (vx, vy)
+            opponent.x += vx * self.dt
+            opponent.y += vy * self.dt
+
+        self.lanes = self.evaluate_lanes()
+        self.step_count += 1
+
+    def run(self, seconds):
+        """
+        Runs the simulation headless for the given amount of simulated time, as fast as possible.
+
+        Returns:
+            dict: The passing lanes after the final step (see `evaluate_lanes`).
+        """
+        for _ in range(round(seconds / self.dt)):
+            self.step()
+        return self.lanes
+
+    def open_lanes(self):
+        """ Returns the passing pairs whose lanes are in range and not pressed by an opponent. """
+        return [pair for pair, (_, colour) in self.lanes.items() if colour == "black"]
+
+    def render(self):
+        """ Pushes simulated positions to the canvas and redraws the passing lines once. """
+        for opponent in self.opponents:
+            opponent.set_position(opponent.x, opponent.y)
+        if self.passing_lines is not None:
+            self.passing_lines.update_lines(self.lanes)
+
+    def start(self):
+        """ Starts the real-time loop on the attached root window. """
+        if self.running:
+            return
+        self.running = True
+        self._last_time = time.perf_counter()
+        self._accumulator = 0.0
+        self._after_id = self.root.after(self.frame_ms, self.tick)
+
+    def stop(self):
+        """ Stops the real-time loop. """
+        self.running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def toggle(self):
+        """ Starts the loop if it is stopped, otherwise stops it. """
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def tick(self):
+        """ Runs as many fixed steps as wall-clock time requires, then redraws once. """
+        now = time.perf_counter()
+        self._accumulator += now - self._last_time
+        self._last_time = now
+
+        steps = 0
+        while self._accumulator >= self.dt and steps < SIM_MAX_STEPS_PER_FRAME:
+            self.step()
+            self._accumulator -= self.dt
+            steps += 1
+
+        # If the UI fell too far behind, drop the backlog instead of trying to catch up forever
+        if steps == SIM_MAX_STEPS_PER_FRAME:
+            self._accumulator = min(self._accumulator, self.dt)
+
+        if steps:
+            self.render()
+        self._after_id = self.root.after(self.frame_ms, self.tick)